@@ -1,10 +1,23 @@
+import bisect
 import os
 from collections import deque
+from operator import attrgetter
+
+# Directorios de salida ya creados, para no repetir os.makedirs() en corridas por lotes.
+_made_dirs = set()
+
+# Plantilla precompilada para cada fila de resultados; el formateo con % es el más
+# rápido de CPython para tuplas de tipos fijos.
+_ROW_FMT = "%s;%d;%d;%d;%d;%d;%d;%d;%d\n"
 
 class Process:
     """
     Representa un proceso con sus atributos y métricas de planificación.
     """
+    __slots__ = ('pid', 'burst_time', 'arrival_time', 'queue_num', 'priority',
+                 'remaining_time', 'first_run_time', 'completion_time',
+                 'turnaround_time', 'waiting_time', 'response_time', 'index')
+
     def __init__(self, pid, burst_time, arrival_time, queue_num, priority):
         self.pid = pid
         self.burst_time = burst_time
@@ -31,11 +44,24 @@ class MLQSimulator:
         self.quantum2 = quantum2
         self.q1 = deque()
         self.q2 = deque()
-        self.q3 = []
-        self.processes_to_arrive = []
+        self.q3 = []  # Lista ordenada de tuplas (burst_time, -prioridad, orden de llegada, proceso)
+        self._q3_seq = 0
+        # Llegadas pendientes ya particionadas por cola, cada una ordenada por arrival_time.
+        # Tuplas inmutables tras la carga; los cursores _a1/_a2/_a3 marcan la próxima llegada.
+        self.arrivals_q1 = ()
+        self.arrivals_q2 = ()
+        self.arrivals_q3 = ()
+        self._a1 = 0
+        self._a2 = 0
+        self._a3 = 0
         self.completed_processes = []
         self.current_time = 0
         self.current_process = None
+        self._pending = 0  # Procesos cargados que aún no terminan; gobierna el bucle principal.
+        # Despacho especializado por cola: cada versión lleva su quantum y su
+        # cola de re-encolado fijados de antemano. Tupla indexada por queue_num
+        # (la posición 0 no se usa) para despachar sin hashing.
+        self._exec_by_queue = (None, self._exec_q1, self._exec_q2, self._exec_q3)
 
     def load_processes(self, file_path):
         """
@@ -43,15 +69,30 @@ class MLQSimulator:
         """
         try:
             with open(file_path, 'r') as f:
-                for line in f:
-                    # Ignorar comentarios y líneas vacías
-                    if line.startswith('#') or not line.strip():
-                        continue
-                    parts = [p.strip() for p in line.split(';')]
-                    if len(parts) == 5:
-                        pid, bt_str, at_str, q_num_str, prio_str = parts
-                        self.processes_to_arrive.append(Process(pid, int(bt_str), int(at_str), int(q_num_str), int(prio_str)))
-            self.processes_to_arrive.sort(key=lambda p: p.arrival_time)
+                data = f.read()
+            processes = []
+            for line in data.splitlines():
+                # Ignorar comentarios y líneas vacías
+                if not line or line[0] == '#':
+                    continue
+                parts = line.split(';')
+                if len(parts) == 5:
+                    pid, bt_str, at_str, q_num_str, prio_str = parts
+                    # int() tolera espacios alrededor, así que solo el pid necesita strip().
+                    processes.append(Process(pid.strip(), int(bt_str), int(at_str), int(q_num_str), int(prio_str)))
+            # Asignar a cada proceso su posición en el orden final por pid permite
+            # rellenar completed_processes por índice y omitir el sort de salida.
+            for i, process in enumerate(sorted(processes, key=attrgetter('pid'))):
+                process.index = i
+            self.completed_processes = [None] * len(processes)
+            self._pending = len(processes)
+            processes.sort(key=attrgetter('arrival_time'))
+            # Particionar por cola desde el inicio evita decidir la cola destino por cada llegada.
+            arrivals = ([], [], [])
+            for process in processes:
+                arrivals[process.queue_num - 1].append(process)
+            # Congelar como tuplas: indexar con un cursor es más barato que popleft().
+            self.arrivals_q1, self.arrivals_q2, self.arrivals_q3 = map(tuple, arrivals)
             return True
         except FileNotFoundError:
             print(f"Error: El archivo '{file_path}' no fue encontrado.")
@@ -64,27 +105,66 @@ class MLQSimulator:
         """
         Ejecuta el ciclo principal de la simulación.
         """
-        while self.processes_to_arrive or self.q1 or self.q2 or self.q3 or self.current_process:
-            self.check_for_arriving_processes()
-            
+        # Resolver los métodos calientes una sola vez evita la búsqueda de
+        # atributo en cada iteración del bucle principal.
+        admit_until = self._admit_until
+        select_next_process = self.select_next_process
+        exec_by_queue = self._exec_by_queue
+
+        # Un solo contador entero sustituye las cinco comprobaciones de verdad
+        # (llegadas, colas y proceso actual) que se evaluaban en cada iteración.
+        while self._pending > 0:
+            admit_until(self.current_time)
+
             if not self.current_process:
-                self.select_next_process()
+                select_next_process()
 
             if self.current_process:
-                self.execute_process()
+                exec_by_queue[self.current_process.queue_num]()
             else:
-                self.current_time += 1
-
-    def check_for_arriving_processes(self):
-        """Mueve procesos que han llegado a sus colas correspondientes."""
-        while self.processes_to_arrive and self.processes_to_arrive[0].arrival_time <= self.current_time:
-            process = self.processes_to_arrive.pop(0)
-            if process.queue_num == 1:
-                self.q1.append(process)
-            elif process.queue_num == 2:
-                self.q2.append(process)
-            elif process.queue_num == 3:
-                self.q3.append(process)
+                # CPU ociosa: saltar directamente a la próxima llegada en vez de avanzar tick a tick.
+                next_arrival = self._next_arrival_time()
+                if next_arrival is not None:
+                    self.current_time = max(self.current_time + 1, next_arrival)
+
+    def _next_arrival_time(self):
+        """Devuelve el instante de la próxima llegada pendiente, o None si no quedan."""
+        candidates = []
+        if self._a1 < len(self.arrivals_q1):
+            candidates.append(self.arrivals_q1[self._a1].arrival_time)
+        if self._a2 < len(self.arrivals_q2):
+            candidates.append(self.arrivals_q2[self._a2].arrival_time)
+        if self._a3 < len(self.arrivals_q3):
+            candidates.append(self.arrivals_q3[self._a3].arrival_time)
+        return min(candidates) if candidates else None
+
+    def _admit_until(self, t):
+        """Mueve a sus colas los procesos con llegada en o antes del instante t."""
+        a = self.arrivals_q1
+        i = self._a1
+        n = len(a)
+        while i < n and a[i].arrival_time <= t:
+            self.q1.append(a[i])
+            i += 1
+        self._a1 = i
+
+        a = self.arrivals_q2
+        i = self._a2
+        n = len(a)
+        while i < n and a[i].arrival_time <= t:
+            self.q2.append(a[i])
+            i += 1
+        self._a2 = i
+
+        a = self.arrivals_q3
+        i = self._a3
+        n = len(a)
+        while i < n and a[i].arrival_time <= t:
+            process = a[i]
+            bisect.insort(self.q3, (process.burst_time, -process.priority, self._q3_seq, process))
+            self._q3_seq += 1
+            i += 1
+        self._a3 = i
 
     def select_next_process(self):
         """Selecciona el siguiente proceso a ejecutar basado en la jerarquía de colas."""
@@ -93,42 +173,69 @@ class MLQSimulator:
         elif self.q2:
             self.current_process = self.q2.popleft()
         elif self.q3:
-            # La cola SJF sí se ordena por burst time y usa la prioridad como desempate.
-            self.q3.sort(key=lambda p: (p.burst_time, -p.priority))
-            self.current_process = self.q3.pop(0)
+            # La lista SJF ya está ordenada por burst time con la prioridad como desempate.
+            _, _, _, self.current_process = self.q3.pop(0)
 
-    def execute_process(self):
-        """Simula la ejecución del proceso actual."""
+    def _exec_q1(self):
+        """Ejecuta el proceso actual con el quantum de la cola 1 (Round Robin)."""
         process = self.current_process
-        
+
         if process.first_run_time == -1:
             process.first_run_time = self.current_time
 
-        quantum = float('inf') # Por defecto para SJF
-        if process.queue_num == 1:
-            quantum = self.quantum1
-        elif process.queue_num == 2:
-            quantum = self.quantum2
+        # El intervalo de ejecución se conoce de antemano: las llegadas que caen
+        # dentro de él se admiten en un solo paso al final.
+        run_time = min(self.quantum1, process.remaining_time)
+        end_time = self.current_time + run_time
+        process.remaining_time -= run_time
+        self.current_time = end_time
+
+        self._admit_until(end_time)
+
+        # La jerarquía Q1 > Q2 > Q3 la aplica select_next_process en la siguiente
+        # iteración; aquí solo se finaliza o se re-encola en la cola propia.
+        if process.remaining_time == 0:
+            self.finalize_process(process)
+        else:
+            self.q1.append(process)
+        self.current_process = None
+
+    def _exec_q2(self):
+        """Ejecuta el proceso actual con el quantum de la cola 2 (Round Robin)."""
+        process = self.current_process
+
+        if process.first_run_time == -1:
+            process.first_run_time = self.current_time
 
-        run_time = min(quantum, process.remaining_time)
-        self.current_time += run_time
+        run_time = min(self.quantum2, process.remaining_time)
+        end_time = self.current_time + run_time
         process.remaining_time -= run_time
+        self.current_time = end_time
 
-        self.check_for_arriving_processes() # Revisa si llegaron procesos durante la ejecución
+        self._admit_until(end_time)
 
         if process.remaining_time == 0:
             self.finalize_process(process)
-            self.current_process = None
-        else: # Si el proceso no ha terminado (debe ser de Q1 o Q2)
-            if self.q1: # Si llega un proceso de alta prioridad
-                 if process.queue_num == 1: self.q1.append(process)
-                 elif process.queue_num == 2: self.q2.append(process)
-                 self.current_process = None # Forzar re-selección
-            else:
-                 # Si no, simplemente se re-encola en su propia cola
-                 if process.queue_num == 1: self.q1.append(process)
-                 elif process.queue_num == 2: self.q2.append(process)
-                 self.current_process = None
+        else:
+            self.q2.append(process)
+        self.current_process = None
+
+    def _exec_q3(self):
+        """Ejecuta el proceso actual de la cola 3 (SJF no expropiativo) hasta terminar."""
+        process = self.current_process
+
+        if process.first_run_time == -1:
+            process.first_run_time = self.current_time
+
+        # Sin quantum: el proceso corre de un tirón hasta completarse.
+        end_time = self.current_time + process.remaining_time
+        process.remaining_time = 0
+        self.current_time = end_time
+
+        self._admit_until(end_time)
+
+        self.finalize_process(process)
+        self.current_process = None
 
 
     def finalize_process(self, process):
@@ -137,31 +244,39 @@ class MLQSimulator:
         process.turnaround_time = process.completion_time - process.arrival_time
         process.waiting_time = process.turnaround_time - process.burst_time
         process.response_time = process.first_run_time - process.arrival_time
-        self.completed_processes.append(process)
+        self.completed_processes[process.index] = process
+        self._pending -= 1
 
     def write_output(self, input_path, output_path):
         """Escribe los resultados de la simulación en un archivo de salida."""
-        self.completed_processes.sort(key=lambda p: p.pid)
-        
-        total_wt, total_ct, total_rt, total_tat = 0, 0, 0, 0
+        # completed_processes ya queda en orden por pid gracias al índice asignado en la carga.
+
+        # Los totales se calculan aparte con sum() en C, sin mezclarlos con la escritura.
+        total_wt = sum(p.waiting_time for p in self.completed_processes)
+        total_ct = sum(p.completion_time for p in self.completed_processes)
+        total_rt = sum(p.response_time for p in self.completed_processes)
+        total_tat = sum(p.turnaround_time for p in self.completed_processes)
         num_processes = len(self.completed_processes)
 
-        # Solo intenta crear el directorio si el path de salida realmente contiene una carpeta.
+        # Solo intenta crear el directorio si el path de salida realmente contiene una carpeta
+        # y no se ha creado ya en esta corrida.
         output_dir = os.path.dirname(output_path)
-        if output_dir: # Esta condición evita el error cuando la ruta está vacía.
+        if output_dir and output_dir not in _made_dirs: # La primera condición evita el error cuando la ruta está vacía.
             os.makedirs(output_dir, exist_ok=True)
+            _made_dirs.add(output_dir)
 
-        with open(output_path, 'w') as f:
+        # Un búfer de 1 MiB agrupa la salida en muy pocas llamadas write() al sistema.
+        with open(output_path, 'w', buffering=1 << 20) as f:
             f.write(f"#archivo: {os.path.basename(input_path)}\n")
             f.write("#etiqueta; BT; AT; Q; Pr; WT; CT; RT; TAT\n")
             
+            # Acumular las filas y escribirlas de una sola vez reduce las llamadas a write().
+            lines = []
             for p in self.completed_processes:
-                f.write(f"{p.pid};{p.burst_time};{p.arrival_time};{p.queue_num};{p.priority};"
-                        f"{p.waiting_time};{p.completion_time};{p.response_time};{p.turnaround_time}\n")
-                total_wt += p.waiting_time
-                total_ct += p.completion_time
-                total_rt += p.response_time
-                total_tat += p.turnaround_time
+                lines.append(_ROW_FMT % (p.pid, p.burst_time, p.arrival_time, p.queue_num,
+                                         p.priority, p.waiting_time, p.completion_time,
+                                         p.response_time, p.turnaround_time))
+            f.write("".join(lines))
 
             if num_processes > 0:
                 avg_wt = total_wt / num_processes